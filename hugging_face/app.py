@@ -974,4 +974,7 @@ with gr.Blocks(theme=gr.themes.Monochrome(), css=my_custom_css) as demo:
     gr.Markdown(article)
 
 demo.queue()
-demo.launch(debug=True)
\ No newline at end of file
+try:
+    demo.launch(debug=True)
+except KeyboardInterrupt:
+    print("\nDemo stopped.")
\ No newline at end of file
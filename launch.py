@@ -0,0 +1,652 @@
+"""One-click launcher for the MatAnyone gradio demo.
+
+Creates a local virtual environment, installs torch with CUDA support and the
+demo requirements, then starts hugging_face/app.py inside that environment.
+"""
+
+import argparse
+import collections
+import ctypes
+import functools
+import glob
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+PYTHON_VERSION = "3.11"
+# resolve symlinks once at import; every later path hangs off these constants
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+DEMO_DIR = os.path.join(SCRIPT_DIR, "hugging_face")
+VENV_DIR = os.path.join(SCRIPT_DIR, ".venv")
+TORCH_INDEX_URL = "https://download.pytorch.org/whl/cu121"
+TORCH_PACKAGES = ["torch", "torchvision", "torchaudio"]
+PIP_CACHE_DIR = os.path.join(SCRIPT_DIR, ".pip-cache")
+VENV_CACHE_DIR = os.path.join(SCRIPT_DIR, ".venv-cache")
+PIP_CHECK_INTERVAL = 7 * 24 * 3600  # seconds between PyPI freshness checks for pip itself
+WHEEL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "matanyone", "wheels")
+
+# shutil.which walks (and stats) every PATH entry per lookup; memoize it
+_which = functools.lru_cache(maxsize=32)(shutil.which)
+
+# a small, preconstructed environment for child processes: fewer variables to
+# copy per spawn while keeping what pip, git, TLS and CUDA need to function.
+# USERPROFILE/APPDATA/LOCALAPPDATA matter on Windows, where pip's per-user
+# config and git's home resolution live; proxy variables are matched by
+# suffix because the lowercase http_proxy spelling is the norm on Linux, and
+# PIP_* passes through wholesale so user index/proxy overrides survive
+_KEPT_ENV_VARS = ("PATH", "HOME", "SYSTEMROOT", "USERPROFILE", "APPDATA", "LOCALAPPDATA",
+                  "TEMP", "TMP", "TMPDIR", "SSL_CERT_FILE", "REQUESTS_CA_BUNDLE",
+                  "LD_LIBRARY_PATH", "CUDA_VISIBLE_DEVICES")
+_CLEAN_ENV = {name: value for name, value in os.environ.items()
+              if name in _KEPT_ENV_VARS
+              or name.upper().endswith("_PROXY")
+              or name.startswith("PIP_")}
+_CLEAN_ENV.setdefault("LANG", "C.UTF-8")
+
+
+def _pip_env():
+    # non-interactive pip with a project-local wheel cache, so repeat
+    # launches skip both the latest-version check and re-downloads
+    env = dict(_CLEAN_ENV)
+    env["PIP_NO_INPUT"] = "1"
+    env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+    env["PIP_CACHE_DIR"] = PIP_CACHE_DIR
+    return env
+
+
+def venv_python():
+    if os.name == "nt":
+        return os.path.join(VENV_DIR, "Scripts", "python.exe")
+    return os.path.join(VENV_DIR, "bin", "python")
+
+
+def ensure_python_version():
+    major, minor = sys.version_info[:2]
+    print(f"Launcher running on Python {major}.{minor}")
+
+
+def _nvml_device_count():
+    """Return the number of NVIDIA GPUs visible to NVML, or 0 if none/unknown.
+
+    Talks to the NVML shared library directly instead of spawning nvidia-smi,
+    which can take several seconds on multi-GPU machines. Prefers pynvml when
+    it is installed; during a first-run bootstrap it may not be, so fall back
+    to loading libnvidia-ml via ctypes.
+    """
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        try:
+            return pynvml.nvmlDeviceGetCount()
+        finally:
+            pynvml.nvmlShutdown()
+    except Exception:
+        pass
+
+    libname = "nvml.dll" if os.name == "nt" else "libnvidia-ml.so.1"
+    try:
+        nvml = ctypes.CDLL(libname)
+    except OSError:
+        return 0
+    if nvml.nvmlInit_v2() != 0:
+        return 0
+    try:
+        count = ctypes.c_uint(0)
+        if nvml.nvmlDeviceGetCount_v2(ctypes.byref(count)) != 0:
+            return 0
+        return count.value
+    finally:
+        nvml.nvmlShutdown()
+
+
+def _interruptible_pause(seconds):
+    """Wait up to `seconds`, returning early on the first keypress."""
+    deadline = time.monotonic() + seconds
+    if os.name == "nt":
+        import msvcrt
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                msvcrt.getch()
+                return
+            time.sleep(0.1)
+    else:
+        import select
+        while time.monotonic() < deadline:
+            if select.select([sys.stdin], [], [], 0.1)[0]:
+                sys.stdin.readline()
+                return
+
+
+def check_nvidia_gpu_early(skip_warning=False):
+    # probe the GPU before any heavy install work so users on CPU-only
+    # machines can bail out before downloading gigabytes of CUDA wheels
+    count = _nvml_device_count()
+    if count > 0:
+        print(f"Found {count} NVIDIA GPU(s).")
+        return True
+    print("No NVIDIA GPU detected. The demo will fall back to CPU and be very slow.")
+    # only pause for interactive users; scripted/CI runs (or --skip-gpu-warning)
+    # should not burn three seconds on a fixed sleep
+    if not skip_warning and sys.stdin.isatty():
+        print("Press Ctrl+C to abort, or any key to continue right away ...")
+        _interruptible_pause(3)
+    return False
+
+
+def check_ffmpeg():
+    if _which("ffmpeg") is None:
+        print("Warning: ffmpeg not found on PATH; exporting demo videos may fail.")
+
+
+def _venv_cache_key():
+    # the cached venv is only valid for the exact requirements + torch pin
+    hasher = hashlib.sha256()
+    with open(os.path.join(DEMO_DIR, "requirements.txt"), "rb") as handle:
+        hasher.update(handle.read())
+    hasher.update(" ".join(TORCH_PACKAGES + [TORCH_INDEX_URL]).encode())
+    return hasher.hexdigest()[:16]
+
+
+def _venv_archive_paths():
+    name = f"venv-py{PYTHON_VERSION.replace('.', '')}-{_venv_cache_key()}"
+    base = os.path.join(VENV_CACHE_DIR, name)
+    return base + ".tar.zst", base + ".tar.gz"
+
+
+def _restore_venv_cache():
+    """Unpack a previously cached venv instead of rebuilding it. Returns True on success.
+
+    venv scripts hard-code the absolute environment path, so the archive
+    records the path it was built at and is refused if the repo has moved.
+    """
+    zst_path, gz_path = _venv_archive_paths()
+    try:
+        if os.path.isfile(zst_path):
+            import zstandard
+            with open(zst_path, "rb") as raw, \
+                    zstandard.ZstdDecompressor().stream_reader(raw) as stream:
+                with tarfile.open(fileobj=stream, mode="r|") as tar:
+                    tar.extractall(SCRIPT_DIR)
+        elif os.path.isfile(gz_path):
+            with tarfile.open(gz_path, "r:gz") as tar:
+                tar.extractall(SCRIPT_DIR)
+        else:
+            return False
+    except Exception as error:
+        print(f"Could not unpack the cached virtual environment ({error}); rebuilding it.")
+        shutil.rmtree(VENV_DIR, ignore_errors=True)
+        return False
+    prefix_file = os.path.join(VENV_DIR, ".cache-prefix")
+    try:
+        with open(prefix_file) as handle:
+            recorded = handle.read().strip()
+    except OSError:
+        recorded = ""
+    if recorded != VENV_DIR:
+        print("Cached virtual environment was built at a different path; rebuilding it.")
+        shutil.rmtree(VENV_DIR, ignore_errors=True)
+        return False
+    print("Restored the virtual environment from cache.")
+    return True
+
+
+def save_venv_cache():
+    """Archive the bootstrapped venv so the next cold start can skip venv+pip."""
+    zst_path, gz_path = _venv_archive_paths()
+    if os.path.isfile(zst_path) or os.path.isfile(gz_path):
+        return
+    os.makedirs(VENV_CACHE_DIR, exist_ok=True)
+    with open(os.path.join(VENV_DIR, ".cache-prefix"), "w") as handle:
+        handle.write(VENV_DIR)
+    print("Caching the virtual environment for faster future launches ...")
+    try:
+        import zstandard
+        tmp_path = zst_path + ".tmp"
+        with open(tmp_path, "wb") as raw, zstandard.ZstdCompressor().stream_writer(raw) as stream:
+            with tarfile.open(fileobj=stream, mode="w|") as tar:
+                tar.add(VENV_DIR, arcname=os.path.basename(VENV_DIR))
+        os.replace(tmp_path, zst_path)
+    except ImportError:
+        tmp_path = gz_path + ".tmp"
+        with tarfile.open(tmp_path, "w:gz") as tar:
+            tar.add(VENV_DIR, arcname=os.path.basename(VENV_DIR))
+        os.replace(tmp_path, gz_path)
+
+
+_windows_python_path = None
+
+
+def _find_windows_python():
+    """Locate the Python 3.11 interpreter with a single `py -0p` call.
+
+    `py -0p` lists every registered interpreter with its path, so one spawn
+    replaces the earlier which("py") + `py -3.11 --version` pair. The result
+    is cached at module level.
+    """
+    global _windows_python_path
+    if _windows_python_path is not None:
+        return _windows_python_path or None
+    _windows_python_path = ""
+    try:
+        listing = subprocess.run(["py", "-0p"], capture_output=True, text=True,
+                                 env=_CLEAN_ENV, close_fds=False)
+    except OSError:
+        return None
+    if listing.returncode != 0:
+        return None
+    # legacy launchers print the -0p listing to stderr, newer ones to stdout
+    for line in (listing.stdout + listing.stderr).splitlines():
+        parts = line.split(None, 1)
+        if len(parts) != 2:
+            continue
+        tag = parts[0]
+        # both the old "-3.11-64" and the new "-V:3.11" tag formats
+        if tag == f"-{PYTHON_VERSION}" or tag.startswith(f"-{PYTHON_VERSION}-") \
+                or tag.endswith(f":{PYTHON_VERSION}"):
+            # the default-interpreter marker "*" sits before the path in the
+            # new format and after it in the legacy one; strip both
+            _windows_python_path = parts[1].strip(" *")
+            return _windows_python_path
+    return None
+
+
+def _venv_site_packages():
+    if os.name == "nt":
+        return os.path.join(VENV_DIR, "Lib", "site-packages")
+    candidates = glob.glob(os.path.join(VENV_DIR, "lib", "python*", "site-packages"))
+    return candidates[0] if candidates else None
+
+
+def _cached_pip_wheel():
+    """Return a pip wheel from the user cache, downloading it on first use."""
+    os.makedirs(WHEEL_CACHE_DIR, exist_ok=True)
+    wheels = sorted(glob.glob(os.path.join(WHEEL_CACHE_DIR, "pip-*.whl")))
+    if wheels:
+        return wheels[-1]
+    import json
+    import urllib.request
+    with urllib.request.urlopen("https://pypi.org/pypi/pip/json", timeout=10) as response:
+        data = json.load(response)
+    for entry in data["urls"]:
+        if entry["filename"].endswith("py3-none-any.whl"):
+            target = os.path.join(WHEEL_CACHE_DIR, entry["filename"])
+            urllib.request.urlretrieve(entry["url"], target)
+            return target
+    raise RuntimeError("no pip wheel found on PyPI")
+
+
+def _bootstrap_pip():
+    """Install pip into the fresh venv by unzipping a cached wheel.
+
+    ensurepip is the slowest part of venv creation: it spawns a child
+    interpreter to extract the bundled wheel. Extracting a wheel we already
+    have into site-packages does the same job in tens of milliseconds.
+    Falls back to ensurepip when no wheel can be fetched.
+    """
+    site_packages = _venv_site_packages()
+    try:
+        if site_packages is None:
+            raise RuntimeError("could not locate the venv site-packages directory")
+        wheel = _cached_pip_wheel()
+    except Exception as error:
+        print(f"Falling back to ensurepip ({error}) ...")
+        subprocess.run([venv_python(), "-m", "ensurepip", "--upgrade"],
+                       capture_output=True, text=True, env=_CLEAN_ENV, close_fds=False)
+        return
+    with zipfile.ZipFile(wheel) as archive:
+        archive.extractall(site_packages)
+    if os.name != "nt":
+        # wheels carry no console scripts, so write the pip entry point by hand
+        shim = os.path.join(VENV_DIR, "bin", "pip")
+        with open(shim, "w") as handle:
+            handle.write(f"#!{venv_python()}\n"
+                         "import sys\n"
+                         "from pip._internal.cli.main import main\n"
+                         "sys.exit(main())\n")
+        os.chmod(shim, 0o755)
+
+
+def create_venv_if_needed():
+    if os.path.isfile(venv_python()):
+        return
+    if _restore_venv_cache():
+        return
+    print(f"Creating virtual environment in {VENV_DIR} ...")
+    if sys.version_info[:2] == tuple(int(part) for part in PYTHON_VERSION.split(".")):
+        # the host interpreter already is the wanted version, so build the
+        # venv in-process instead of paying for a fresh `python -m venv`
+        # spawn; symlinks on POSIX avoid copying the interpreter binary
+        from venv import EnvBuilder
+        EnvBuilder(with_pip=False, symlinks=(os.name != "nt"), upgrade_deps=False).create(VENV_DIR)
+        _bootstrap_pip()
+        return
+    if os.name == "nt":
+        interpreter = _find_windows_python()
+        if interpreter is None:
+            sys.exit(f"Python {PYTHON_VERSION} was not found by the Windows 'py' launcher. "
+                     "Please install it from python.org.")
+        cmd = [interpreter, "-m", "venv", "--without-pip", VENV_DIR]
+    else:
+        interpreter = _which(f"python{PYTHON_VERSION}") or sys.executable
+        cmd = [interpreter, "-m", "venv", "--without-pip", VENV_DIR]
+    result = subprocess.run(cmd, capture_output=True, text=True, env=_CLEAN_ENV, close_fds=False)
+    if result.returncode != 0:
+        sys.exit(f"Failed to create the virtual environment:\n{result.stderr}")
+    _bootstrap_pip()
+
+
+def _venv_pip_version():
+    """Read the venv's pip version without spawning an interpreter.
+
+    importlib.metadata can be pointed at the venv's site-packages directly,
+    which replaces a fork+exec+`import pip` round-trip with a couple of
+    directory reads in this process.
+    """
+    site_packages = _venv_site_packages()
+    if site_packages is None:
+        return None
+    from importlib.metadata import distributions
+    try:
+        for dist in distributions(name="pip", path=[site_packages]):
+            return dist.version
+    except Exception:
+        pass
+    return None
+
+
+def _latest_pip_version():
+    # one cheap JSON request with a short timeout; None when offline
+    import json
+    import urllib.request
+    try:
+        with urllib.request.urlopen("https://pypi.org/pypi/pip/json", timeout=2) as response:
+            return json.load(response)["info"]["version"]
+    except Exception:
+        return None
+
+
+def upgrade_pip():
+    """Upgrade pip in the venv, but only when it is actually outdated.
+
+    Unconditionally running `pip install --upgrade pip` costs a network
+    round-trip on every launch. Instead the installed version is cached in
+    .venv/.pip_version_check and PyPI is consulted at most once a week.
+    """
+    stamp = os.path.join(VENV_DIR, ".pip_version_check")
+    local = _venv_pip_version()
+    if local is not None:
+        try:
+            with open(stamp) as handle:
+                cached_version, cached_time = handle.read().split()
+        except (OSError, ValueError):
+            cached_version, cached_time = "", "0"
+        if cached_version == local and time.time() - float(cached_time) < PIP_CHECK_INTERVAL:
+            return
+        latest = _latest_pip_version()
+        if latest is None or latest == local:
+            # offline or already current; remember so upcoming launches skip the check
+            with open(stamp, "w") as handle:
+                handle.write(f"{local} {int(time.time())}")
+            return
+    print("Upgrading pip ...")
+    returncode, tail = _run_streaming([venv_python(), "-m", "pip", "install", "--upgrade", "pip"],
+                                      env=_pip_env())
+    if returncode != 0:
+        sys.exit("Failed to upgrade pip:\n" + "\n".join(tail))
+    upgraded = _venv_pip_version()
+    if upgraded is not None:
+        with open(stamp, "w") as handle:
+            handle.write(f"{upgraded} {int(time.time())}")
+
+
+def _torch_install_mtime():
+    site_packages = _venv_site_packages()
+    if site_packages is None:
+        return None
+    try:
+        return os.path.getmtime(os.path.join(site_packages, "torch", "__init__.py"))
+    except OSError:
+        return None
+
+
+def ensure_torch_with_cuda():
+    """Return the pip command to install torch with CUDA, or None if it is ready.
+
+    Importing torch just to ask torch.cuda.is_available() costs seconds of
+    CUDA runtime init, so a successful probe is recorded in
+    .venv/.torch_cuda_ok and trusted as long as it is newer than the torch
+    install itself.
+    """
+    stamp = os.path.join(VENV_DIR, ".torch_cuda_ok")
+    torch_mtime = _torch_install_mtime()
+    try:
+        stamp_mtime = os.path.getmtime(stamp)
+    except OSError:
+        stamp_mtime = None
+    if stamp_mtime is not None and torch_mtime is not None and stamp_mtime >= torch_mtime:
+        return None
+    try:
+        probe = subprocess.run(
+            [venv_python(), "-c",
+             "import torch, sys; sys.exit(0 if torch.cuda.is_available() else 2)"],
+            capture_output=True, text=True, timeout=30, env=_CLEAN_ENV, close_fds=False)
+    except subprocess.TimeoutExpired:
+        probe = None
+    if probe is not None and probe.returncode == 0:
+        print("torch with CUDA support is already installed.")
+        with open(stamp, "w"):
+            pass
+        return None
+    print("Installing torch with CUDA support (this downloads several GB) ...")
+    # never fall back to a source build for torch; only wheels make sense here
+    return [venv_python(), "-m", "pip", "install", "--only-binary=:all:", *TORCH_PACKAGES,
+            "--index-url", TORCH_INDEX_URL]
+
+
+def _filter_torch_from_requirements(requirements):
+    """Copy requirements.txt to a temp file without the torch packages.
+
+    The torch install job pins its own versions against the CUDA index; keeping
+    torch out of the requirements job lets both pip installs run concurrently
+    without racing on the same packages.
+    """
+    torch_names = {name.lower() for name in TORCH_PACKAGES}
+    kept = []
+    with open(requirements) as handle:
+        for line in handle:
+            name = re.split(r"[<>=!~\[; ]", line.strip(), 1)[0].lower()
+            if name in torch_names:
+                continue
+            kept.append(line)
+    fd, path = tempfile.mkstemp(prefix="matanyone-requirements-", suffix=".txt", text=True)
+    with os.fdopen(fd, "w") as handle:
+        handle.writelines(kept)
+    return path
+
+
+def install_requirements():
+    """Return the pip command installing the demo requirements.
+
+    When a requirements.lock (generated with `pip-compile --generate-hashes`
+    from requirements.txt) is checked in next to requirements.txt, it is
+    preferred: --no-deps skips the resolver's graph walk and --require-hashes
+    skips index metadata fetches beyond the exact pinned URLs.
+    """
+    lock = os.path.join(DEMO_DIR, "requirements.lock")
+    if os.path.isfile(lock):
+        print("Installing demo requirements from the lock file ...")
+        return [venv_python(), "-m", "pip", "install", "--require-hashes", "--no-deps", "-r", lock]
+    requirements = os.path.join(DEMO_DIR, "requirements.txt")
+    print("Installing demo requirements ...")
+    filtered = _filter_torch_from_requirements(requirements)
+    return [venv_python(), "-m", "pip", "install", "--prefer-binary", "-r", filtered]
+
+
+def _run_streaming(cmd, label=None, env=None):
+    """Run a command echoing its output live; return (returncode, tail lines).
+
+    pip's progress output for the torch wheels runs to megabytes;
+    capture_output would buffer all of it, hide progress, and can even
+    deadlock pip behind a full pipe. Streaming line by line keeps memory
+    bounded, with a short tail retained for error reporting.
+    """
+    tail = collections.deque(maxlen=200)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1, env=env, close_fds=False)
+    for line in proc.stdout:
+        line = line.rstrip()
+        tail.append(line)
+        print(f"[{label}] {line}" if label else line)
+    proc.wait()
+    return proc.returncode, tail
+
+
+def _stream_pip_job(label, cmd):
+    returncode, tail = _run_streaming(cmd, label=label, env=_pip_env())
+    if returncode != 0:
+        raise RuntimeError(f"pip install ({label}) failed with exit code {returncode}:\n"
+                           + "\n".join(tail))
+
+
+def run_pip_jobs(jobs):
+    """Run the given (label, pip command) jobs concurrently.
+
+    The torch wheels and the requirements are independent downloads, so
+    fetching them in parallel roughly halves cold-install wall time on fast
+    links.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {pool.submit(_stream_pip_job, label, cmd): label for label, cmd in jobs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except RuntimeError as error:
+                sys.exit(str(error))
+
+
+def launch_demo():
+    cmd = [venv_python(), "app.py"]
+    print("Launching the MatAnyone demo ...")
+    if os.name != "nt":
+        # replace the bootstrap process outright instead of keeping a parent
+        # interpreter resident just to wait on the demo; interrupt/exit
+        # handling is the demo's own from here on. exec has no cwd
+        # parameter, so chdir only here, at the point of no return
+        os.chdir(DEMO_DIR)
+        os.execv(venv_python(), cmd)
+    # Windows execv spawns a detached child and returns the shell prompt
+    # early, so keep the plain subprocess there
+    try:
+        subprocess.run(cmd, check=True, cwd=DEMO_DIR, close_fds=False)
+    except KeyboardInterrupt:
+        print("\nDemo stopped.")
+    except subprocess.CalledProcessError as error:
+        sys.exit(error.returncode)
+    sys.exit(0)
+
+
+def _prewarm_stat_cache():
+    """Stat every path the launcher will branch on, concurrently.
+
+    On NFS-mounted checkouts (common on ML clusters) each stat is a network
+    round-trip; issuing them all from a small thread pool before any
+    decision branches overlaps the latencies, so the serial
+    isfile/getmtime checks that follow hit warm caches.
+    """
+    paths = [
+        VENV_DIR,
+        venv_python(),
+        os.path.join(DEMO_DIR, "requirements.txt"),
+        os.path.join(DEMO_DIR, "requirements.lock"),
+        os.path.join(VENV_DIR, ".pip_version_check"),
+        os.path.join(VENV_DIR, ".torch_cuda_ok"),
+        _ready_stamp_path(),
+        VENV_CACHE_DIR,
+        WHEEL_CACHE_DIR,
+    ]
+    site_packages = _venv_site_packages()
+    if site_packages is not None:
+        paths.append(os.path.join(site_packages, "torch", "__init__.py"))
+
+    def _stat(path):
+        try:
+            os.stat(path)
+        except OSError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_stat, paths))
+
+
+def _ready_stamp_path():
+    return os.path.join(VENV_DIR, f".ready-{_venv_cache_key()}")
+
+
+def _bootstrap_is_ready():
+    """Warm-start fast path: trust the stamp left by a successful bootstrap.
+
+    The stamp name is keyed by the requirements + torch pin and the stamp
+    must be newer than the installed torch package, so editing
+    requirements.txt or reinstalling torch invalidates it. While it holds,
+    every check and pip call can be skipped for the cost of a few stats.
+    """
+    try:
+        stamp_mtime = os.path.getmtime(_ready_stamp_path())
+    except OSError:
+        return False
+    torch_mtime = _torch_install_mtime()
+    return torch_mtime is not None and stamp_mtime >= torch_mtime
+
+
+def _mark_bootstrap_ready():
+    with open(_ready_stamp_path(), "w"):
+        pass
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Bootstrap and launch the MatAnyone gradio demo.")
+    parser.add_argument("--skip-gpu-warning", action="store_true",
+                        help="do not pause when no NVIDIA GPU is detected")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    _prewarm_stat_cache()
+    if _bootstrap_is_ready():
+        launch_demo()
+        return
+    # the three preflight checks are independent, so overlap them; the no-GPU
+    # grace pause then runs alongside the version and ffmpeg lookups instead
+    # of adding to them
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        checks = [
+            pool.submit(ensure_python_version),
+            pool.submit(check_nvidia_gpu_early, args.skip_gpu_warning),
+            pool.submit(check_ffmpeg),
+        ]
+        for check in checks:
+            check.result()
+    create_venv_if_needed()
+    upgrade_pip()
+    jobs = []
+    torch_cmd = ensure_torch_with_cuda()
+    if torch_cmd is not None:
+        jobs.append(("torch", torch_cmd))
+    jobs.append(("requirements", install_requirements()))
+    run_pip_jobs(jobs)
+    _mark_bootstrap_ready()
+    save_venv_cache()
+    launch_demo()
+
+
+if __name__ == "__main__":
+    main()